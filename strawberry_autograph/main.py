@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+from dataclasses import is_dataclass
 from datetime import datetime
 from enum import Enum
 from functools import cached_property
-from itertools import chain
+from functools import lru_cache
 from logging import getLogger
+from sys import intern
 from typing import Any
+from typing import NamedTuple
 from typing import get_args
 from typing import get_origin
 from typing import Union
@@ -22,6 +25,24 @@ from strawberry.utils.str_converters import to_snake_case  # noqa: WPS347
 logger = getLogger(__name__)
 
 FieldTree = dict[str, 'FieldTree']
+
+
+class FragmentNode(NamedTuple):
+    """Columnar fragment node: field names with parallel child nodes."""
+
+    names: tuple[str, ...]
+    children: tuple['FragmentNode | None', ...]
+
+
+def build_fragment_node(tree: FieldTree) -> FragmentNode:
+    """Convert a nested dict tree into its columnar representation."""
+    children = tuple(
+        build_fragment_node(subtree) if subtree else None
+        for subtree in tree.values()
+    )
+    return FragmentNode(names=tuple(tree.keys()), children=children)
+
+
 InputScalars = Union[
     strawberry.UNSET,
     None,
@@ -38,64 +59,222 @@ ArbitraryInput = Union[
     dict[str, 'ArbitraryInput'],
 ]
 ROOT_DEPTH = 1
+INPUTS_CACHE_LIMIT = 128
+MAX_PRECOMPUTED_DEPTH = 64
+
+_indents = tuple('\t' * depth for depth in range(MAX_PRECOMPUTED_DEPTH))
+
+
+def _indent_for(depth: int) -> str:
+    """Look up a tab indent, falling back for absurdly deep trees."""
+    if depth < MAX_PRECOMPUTED_DEPTH:
+        return _indents[depth]
+    return '\t' * depth
+
+
+_cached_snake_case = lru_cache(maxsize=4096)(to_snake_case)
+
+
+@lru_cache(maxsize=4096)
+def _cached_camel_case(name: str) -> str:
+    """Camel-case a field name and intern the result.
+
+    Interned names collapse to singletons, so the dict lookups they key
+    short-circuit on identity.
+    """
+    return intern(to_camel_case(name))
+
+
+def freeze_input(recursive_input: ArbitraryInput) -> tuple:
+    """Convert an input tree into a hashable cache key.
+
+    Scalars carry their type in the key: True, 1, and 1.0 compare and
+    hash as equal but serialize differently.
+    """
+    if isinstance(recursive_input, dict):
+        frozen_pairs = tuple(
+            (inkey, freeze_input(invalue))
+            for inkey, invalue in recursive_input.items()
+        )
+        return ('{', frozen_pairs)
+    elif isinstance(recursive_input, list):
+        return ('[', tuple(map(freeze_input, recursive_input)))
+    return (type(recursive_input), recursive_input)
+
+
+NULL_LITERAL = 'null'
+TRUE_LITERAL = 'true'
+FALSE_LITERAL = 'false'
+
+# The same C helper json.dumps uses for strings, without encoder setup.
+_encode_string = json.encoder.encode_basestring_ascii
+
+_scalar_encoders: dict[type, Any] = {
+    str: _encode_string,
+    int: str,
+    float: repr,
+    bool: lambda flag: TRUE_LITERAL if flag else FALSE_LITERAL,
+    type(None): lambda _null: NULL_LITERAL,
+    datetime: lambda stamp: _encode_string(stamp.isoformat()),
+}
 
 
 def serialize_scalar(scalar: InputScalars):
     """Serialize scalar values using JSON for GraphQL compatibility."""
-    scalar_type = type(scalar)
-    if scalar_type in {str, int, float, bool, type(None)}:
-        return json.dumps(scalar)
-    elif scalar_type is datetime:
-        return json.dumps(scalar.isoformat())
+    encoder = _scalar_encoders.get(type(scalar))
+    if encoder is not None:
+        return encoder(scalar)
     elif isinstance(scalar, Enum):
-        return scalar.value
+        # Non-str values (e.g. int-backed enums) must still join cleanly.
+        enum_value = scalar.value
+        return enum_value if isinstance(enum_value, str) else str(enum_value)
     elif scalar is strawberry.UNSET:
-        return json.dumps(None)
-    raise TypeError(f'Unsupported type: {scalar_type}')
+        return NULL_LITERAL
+    raise TypeError(f'Unsupported type: {type(scalar)}')
+
+
+def _write_input_pairs(
+    pairs: dict[str, ArbitraryInput],
+    buffer: list[str],
+    camel_case=_cached_camel_case,
+) -> None:
+    """Append serialized dict tokens into a single flat buffer.
+
+    The default argument binds the converter as a local, keeping the
+    per-pair loop free of module-global lookups.
+    """
+    buffer.append('{ ')
+    first = True
+    for pkey, pvalue in pairs.items():
+        if not first:
+            buffer.append(', ')
+        first = False
+        buffer.append(camel_case(pkey))
+        buffer.append(': ')
+        _write_input(pvalue, buffer)
+    buffer.append(' }')
+
+
+def _write_input(
+    recursive_input: ArbitraryInput,
+    buffer: list[str],
+    scalar_encoder=serialize_scalar,
+) -> None:
+    """Append serialized input tokens into a single flat buffer."""
+    if isinstance(recursive_input, dict):
+        _write_input_pairs(recursive_input, buffer)
+    elif isinstance(recursive_input, list):
+        buffer.append('[ ')
+        first = True
+        for element in recursive_input:
+            if not first:
+                buffer.append(', ')
+            first = False
+            _write_input(element, buffer)
+        buffer.append(' ]')
+    else:
+        buffer.append(scalar_encoder(recursive_input))
+
+
+# Keyed by id(); the paired wrapper reference keeps the id from being reused.
+_core_type_cache: dict[int, tuple[Any, Any]] = {}
+
+
+def _core_type(wrapped_type: Any) -> Any:
+    """Strip of_type wrappers, caching the result per wrapper object."""
+    cached = _core_type_cache.get(id(wrapped_type))
+    if cached is not None:
+        return cached[1]
+    core = wrapped_type
+    while True:
+        try:
+            core = core.of_type
+        except AttributeError:
+            break
+    _core_type_cache[id(wrapped_type)] = (wrapped_type, core)
+    return core
 
 
 def parse_input_tree(
     field_name: str,
     field,
     level: int = 0,
-) -> FieldTree:
-    """Recursively parse a field and its subfields."""
+) -> tuple[str, FieldTree]:
+    """Recursively parse a field and its subfields into a name-tree pair."""
     field_type = getattr(field, 'type', None)
     if field_type is None:
-        return {field_name: {}}
-    while core_field := getattr(field_type, 'of_type', None):  # noqa: WPS332, E501
-        field_type = core_field
-    subfields: FieldTree = dict(
-        chain.from_iterable((
-            parse_input_tree(fname, subfield, level=level + 1).items()
-            for fname, subfield in getattr(field_type, 'fields', {}).items()
-        )),
-    )
-    return {field_name: subfields}
+        return field_name, {}
+    field_type = _core_type(field_type)
+    subfields: FieldTree = {
+        intern(fname): parse_input_tree(fname, subfield, level=level + 1)[1]
+        for fname, subfield in getattr(field_type, 'fields', {}).items()
+    }
+    return intern(field_name), subfields
+
 
+# Keyed by id(); the paired type reference keeps the id from being reused.
+_unwrapped_tree_cache: dict[int, tuple[Any, FieldTree]] = {}
 
-def unwrap_strawberry_type(type_: Any) -> FieldTree:
-    """Recursively unwraps a Strawberry response type."""
-    type_annotations = getattr(type_, '__annotations__', {})
+
+def _strip_optional(type_args: tuple[Any, ...], none_type: type) -> Any:
+    """Extract the non-None member from Optional-style union args."""
+    if len(type_args) == 2:
+        return type_args[0] if type_args[0] is not none_type else type_args[1]
+    return next(typ for typ in type_args if typ is not none_type)
+
+
+def unwrap_strawberry_type(type_: Any) -> FieldTree:  # noqa: WPS210
+    """Unwrap a Strawberry response type with an explicit worklist."""
+    cached = _unwrapped_tree_cache.get(id(type_))
+    if cached is not None:
+        return cached[1]
+    # Local bindings: module-global and typing lookups are hot here.
+    local_get_origin = get_origin
+    local_get_args = get_args
+    none_type = type(None)
     tree: FieldTree = {}
-    for field_name, field_type in type_annotations.items():
-        origin = get_origin(field_type)
-        # Optional types are unions with None
-        if origin is Union:
-            field_type = next(
-                typ
-                for typ in get_args(field_type)
-                if typ is not type(None)  # noqa: WPS516
+    worklist = [(tree, getattr(type_, '__annotations__', {}))]
+    while worklist:
+        subtree, type_annotations = worklist.pop()
+        for field_name, field_type in type_annotations.items():
+            origin = local_get_origin(field_type)
+            # Optional types are unions with None
+            if origin is Union:
+                field_type = _strip_optional(
+                    local_get_args(field_type),
+                    none_type,
+                )
+            elif origin is list:
+                field_type = local_get_args(field_type)[0]
+            nested: FieldTree = {}
+            subtree[_cached_camel_case(field_name)] = nested
+            worklist.append(
+                (nested, getattr(field_type, '__annotations__', {})),
             )
-        elif origin is list:
-            field_type = get_args(field_type)[0]
-        tree[to_camel_case(field_name)] = unwrap_strawberry_type(field_type)
+    _unwrapped_tree_cache[id(type_)] = (type_, tree)
     return tree
 
 
 class GQLExecutableTemplate:  # noqa: WPS214
     """GraphQL operation template injectable with strawberry inputs."""
 
+    __slots__ = (
+        'executor',
+        'field',
+        'name',
+        'reqtype',
+        'method_name',
+        'input_tree',
+        'fragment_tree',
+        'serialized_fragment_tree',
+        '_prefix',
+        '_suffix',
+        '_inputs_cache',
+        '_render_keys',
+        '_render_query',
+        '__weakref__',
+    )
+
     def __init__(
         self,
         executor: Schema,
@@ -109,7 +288,17 @@ class GQLExecutableTemplate:  # noqa: WPS214
         self.field = request
         self.name = name
         self.reqtype = 'mutation' if is_mutation else 'query'
-        self.method_name = to_snake_case(name)
+        self.method_name = _cached_snake_case(name)
+        self.input_tree = self._parse_input_tree()
+        self.fragment_tree = self._parse_fragment_tree()
+        self.serialized_fragment_tree = self._serialize_fragment_tree()
+        self._prefix = f'{self.reqtype} {self.name}'
+        self._suffix = f' {{\n{self.serialized_fragment_tree}\n}}'
+        self._inputs_cache: dict[tuple, str] = {}
+        self._render_keys = frozenset(
+            map(_cached_snake_case, self.input_tree.keys()),
+        )
+        self._render_query = self._compile_query_renderer()
 
     def __call__(self, **inputs: ArbitraryInput | Any) -> ExecutionResult:
         """Generate a GraphQL operation and execute it."""
@@ -123,107 +312,142 @@ class GQLExecutableTemplate:  # noqa: WPS214
 
     def __str__(self) -> str:
         """Return the operation name and args in snake case."""
-        args = ', '.join(map(to_snake_case, self.input_tree.keys()))
+        args = ', '.join(map(_cached_snake_case, self.input_tree.keys()))
         args = f'({args})' if args else ''
         return f'{self.reqtype} {self.method_name}{args}'
 
     def generate_query(self, **inputs: ArbitraryInput | Any) -> str:
         """Generate a GraphQL operation."""
-        inputs_string = self.serialize_input({
-            to_camel_case(inkey): self._try_asdict(invalue)
+        if not inputs:
+            return self._prefix + self._suffix
+        if inputs.keys() == self._render_keys:
+            return self._render_query(
+                inputs,
+                _write_input,
+                self._try_asdict,
+            )
+        inputs_string = self._serialize_inputs_cached({
+            _cached_camel_case(inkey): self._try_asdict(invalue)
             for inkey, invalue in inputs.items()
         })
-        operation_string = (
-            f'{self.reqtype} {self.name}({inputs_string})'
-            if inputs_string
-            else f'{self.reqtype} {self.name}'
-        )
-        return f'{operation_string} {{\n{self.serialized_fragment_tree}\n}}'
+        if inputs_string:
+            return f'{self._prefix}({inputs_string}){self._suffix}'
+        return self._prefix + self._suffix
 
-    @cached_property
-    def input_tree(self) -> FieldTree:
+    def _parse_input_tree(self) -> FieldTree:
         """Parse the argument structure."""
-        nesting_pairings = (
-            parse_input_tree(argname, argfield).items()
+        return dict(
+            parse_input_tree(argname, argfield)
             for argname, argfield in self.field.args.items()
         )
-        return dict(chain.from_iterable(nesting_pairings))
 
-    @cached_property
-    def fragment_tree(self) -> FieldTree:
+    def _parse_fragment_tree(self) -> FragmentNode:
         """Parse the response fragment structure."""
-        response_type = self.field.extensions['strawberry-definition'].type
-        while inner_type := getattr(response_type, 'of_type', None):  # noqa: WPS332, E501
-            response_type = inner_type
+        response_type = _core_type(
+            self.field.extensions['strawberry-definition'].type,
+        )
         response_models = response_type.types
         fragment_trees = map(unwrap_strawberry_type, response_models)
         fragment_names = (
             rtp.__strawberry_definition__.name
             for rtp in response_models
         )
-        return dict(zip(fragment_names, fragment_trees))
+        return build_fragment_node(dict(zip(fragment_names, fragment_trees)))
 
-    @cached_property
-    def serialized_fragment_tree(self) -> str:
+    def _serialize_fragment_tree(self) -> str:
         """Serialize the response fragment structure for template."""
-        serialized = '\n'.join(
-            self._serialize_fragment_tree_lines(self.fragment_tree),
-        )
-        return serialized
+        lines: list[str] = []
+        self._serialize_fragment_tree_lines(self.fragment_tree, lines)
+        return '\n'.join(lines)
 
-    def serialize_input(  # noqa: WPS210
+    def serialize_input(self, recursive_input: ArbitraryInput) -> str:
+        """Serialize input to a GraphQL-friendly format."""
+        buffer: list[str] = []
+        _write_input(recursive_input, buffer)
+        return ''.join(buffer)
+
+    def _serialize_inputs_cached(
         self,
-        recursive_input: ArbitraryInput,
+        preprocessed_inputs: dict[str, ArbitraryInput],
     ) -> str:
-        """Recursively serialize input to a GraphQL-friendly format."""
-        if isinstance(recursive_input, dict):
-            preprocessed_pairs = (
-                (to_camel_case(pkey), self.serialize_input(pvalue))
-                for pkey, pvalue in recursive_input.items()
-            )
-            serialized_pairset = ', '.join((
-                f'{camelkey}: {strvalue}'
-                for camelkey, strvalue in preprocessed_pairs
-            ))
-            return f'{{ {serialized_pairset} }}'
-        elif isinstance(recursive_input, list):
-            serialized_array = ', '.join(
-                self.serialize_input(element)
-                for element in recursive_input
+        """Serialize inputs, reusing results for repeated payloads."""
+        try:
+            cache_key = freeze_input(preprocessed_inputs)
+            cached = self._inputs_cache.get(cache_key)
+        except TypeError:
+            return self.serialize_input(preprocessed_inputs)
+        if cached is None:
+            cached = self.serialize_input(preprocessed_inputs)
+            if len(self._inputs_cache) < INPUTS_CACHE_LIMIT:
+                self._inputs_cache[cache_key] = cached
+        return cached
+
+    def _compile_query_renderer(self) -> Any:  # noqa: WPS210
+        """Compile a renderer with the operation constants inlined.
+
+        The query skeleton (prefix, argument labels, fragment suffix) is
+        known at construction time, so it is baked into a generated
+        function as string literals. Only the argument values are
+        serialized at request time.
+        """
+        camel_names = tuple(self.input_tree.keys())
+        if not camel_names:
+            # Unreachable through generate_query: empty calls return the
+            # precomputed prefix + suffix before renderer dispatch.
+            return None
+        opening = f'{self._prefix}({{ '
+        closing = f' }}){self._suffix}'
+        source_lines = [
+            'def render(inputs, write_input, try_asdict):',
+            f'    buf = [{opening!r}]',
+        ]
+        separator = ''
+        for camel_name in camel_names:
+            label = f'{separator}{camel_name}: '
+            snake_name = _cached_snake_case(camel_name)
+            source_lines.append(f'    buf.append({label!r})')
+            source_lines.append(
+                f'    write_input(try_asdict(inputs[{snake_name!r}]), buf)',
             )
-            return f'[ {serialized_array} ]'
-        return serialize_scalar(recursive_input)
+            separator = ', '
+        source_lines.append(f'    buf.append({closing!r})')
+        source_lines.append("    return ''.join(buf)")
+        namespace: dict[str, Any] = {}
+        exec('\n'.join(source_lines), namespace)  # noqa: S102, WPS421
+        return namespace['render']
 
     def _try_asdict(self, maybedataclass: Any) -> Any:
-        try:
+        if is_dataclass(maybedataclass) and not isinstance(maybedataclass, type):  # noqa: E501
             return strawberry.asdict(maybedataclass)
-        except TypeError:
-            return maybedataclass
+        return maybedataclass
 
     def _serialize_fragment_tree_lines(  # noqa: WPS210
         self,
-        tree: FieldTree,
+        tree: FragmentNode,
+        lines: list[str],
         depth=ROOT_DEPTH,
-    ) -> list[str]:
-        """Recursively serialize response fragment fields."""
-        lines = []
-        indent = '\t' * depth
-        for field_name, nested_fields in tree.items():
-            prefix_for_root = '... on ' if depth == ROOT_DEPTH else ''
+    ) -> None:
+        """Serialize response fragment fields with an explicit stack."""
+        stack = [zip(tree.names, tree.children)]
+        while stack:
+            current_depth = depth + len(stack) - 1
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                if stack:
+                    closing_indent = _indent_for(current_depth - 1)
+                    lines.append(f'{closing_indent}}}')
+                continue
+            field_name, nested_node = entry
+            indent = _indent_for(current_depth)
+            prefix_for_root = '... on ' if current_depth == ROOT_DEPTH else ''
             line = f'{indent}{prefix_for_root}{field_name}'
-            if nested_fields:
+            if nested_node is not None:
                 lines.append(f'{line} {{')
-                nested_serialization = self._serialize_fragment_tree_lines(
-                    nested_fields,
-                    depth=depth + 1,
-                )
-                lines.extend(nested_serialization)
-                lines.append(f'{indent}}}')
+                stack.append(zip(nested_node.names, nested_node.children))
             else:
                 lines.append(line)
 
-        return lines
-
 
 class AutoGraphClient:
     """A graphql client that mirrors the whole app schema."""
@@ -231,8 +455,10 @@ class AutoGraphClient:
     def __init__(self, schema: Schema):  # noqa: WPS210
         """Parse all operations as executable templates."""
         self.schema = schema
-        queries = schema._schema.to_kwargs()['query'].fields  # noqa: WPS437
-        mutations = schema._schema.to_kwargs()['mutation'].fields  # noqa: WPS437, E501
+        schema_kwargs = schema._schema.to_kwargs()  # noqa: WPS437
+        queries = schema_kwargs['query'].fields
+        mutation_type = schema_kwargs.get('mutation')
+        mutations = mutation_type.fields if mutation_type is not None else {}
         query_templates = [
             GQLExecutableTemplate(
                 self.schema,
@@ -251,25 +477,14 @@ class AutoGraphClient:
             )
             for name, mfield in mutations.items()
         ]
-        for template in (*query_templates, *mutation_templates):
+        self._ops: list[GQLExecutableTemplate] = [
+            *query_templates,
+            *mutation_templates,
+        ]
+        for template in self._ops:
             setattr(self, template.method_name, template)
 
     @cached_property
     def operations(self) -> list[str]:
         """List all executable template operations."""
-        excluded_names = {
-            'schema',
-            'operations',
-        }
-        checks = {
-            lambda name: name not in excluded_names,
-            lambda name: not name.startswith('_'),
-        }
-        operation_names = list(
-            filter(
-                lambda name: all(check(name) for check in checks),
-                self.__dict__,
-            ),
-        )
-        operations = (getattr(self, name) for name in operation_names)
-        return list(map(str, operations))
+        return [str(template) for template in self._ops]